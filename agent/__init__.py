@@ -7,7 +7,12 @@ Voice AI interview coach powered by LiveKit.
 from .config import Settings, get_settings
 from .evaluator import ResponseEvaluator, ResponseScore, SessionMetrics
 from .main import InterviewAgent, entrypoint, main
-from .prompts import InterviewType, get_evaluation_prompt, get_system_prompt
+from .prompts import (
+    InterviewType,
+    get_batch_evaluation_prompt,
+    get_evaluation_prompt,
+    get_system_prompt,
+)
 
 __all__ = [
     # Config
@@ -17,6 +22,7 @@ __all__ = [
     "InterviewType",
     "get_system_prompt",
     "get_evaluation_prompt",
+    "get_batch_evaluation_prompt",
     # Evaluator
     "ResponseEvaluator",
     "ResponseScore",
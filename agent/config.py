@@ -48,6 +48,24 @@ class Settings(BaseSettings):
     chunk_size: int = Field(default=512, ge=100, le=2000)
     chunk_overlap: int = Field(default=50, ge=0, le=200)
 
+    # Evaluation Configuration
+    max_concurrent_evals: int = Field(
+        default=8,
+        ge=1,
+        description="Maximum in-flight evaluation requests to OpenAI",
+    )
+    eval_batch_size: int = Field(
+        default=5,
+        ge=1,
+        le=20,
+        description="Responses scored per LLM call in batch evaluation",
+    )
+    max_sessions_in_memory: int = Field(
+        default=256,
+        ge=1,
+        description="Most recent evaluation sessions kept in memory per worker",
+    )
+
     # Application Settings
     log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR"] = Field(default="INFO")
     debug: bool = Field(default=False)
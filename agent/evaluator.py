@@ -5,17 +5,53 @@ Multi-dimensional evaluation of candidate responses with
 scoring, feedback generation, and session analytics.
 """
 
+import asyncio
+import json
 import logging
+import re
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from functools import lru_cache
+from itertools import chain, islice
+from statistics import fmean
+from typing import Any, Optional
 
-from openai import OpenAI
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
 
-from .prompts import get_evaluation_prompt
+from .prompts import get_batch_evaluation_prompt, get_evaluation_prompt
 
 logger = logging.getLogger(__name__)
 
+# Line markers recognised when parsing free-form (non-JSON) evaluations
+_MARKER_RE = re.compile(r"(?P<kind>strength|improve|suggest|consider|score|/10)", re.IGNORECASE)
+
+
+@lru_cache(maxsize=1)
+def _shared_client() -> AsyncOpenAI:
+    """
+    Get the process-wide async OpenAI client.
+    
+    Sharing one client lets every evaluator reuse the same keep-alive
+    connection pool instead of paying a TLS handshake per instance.
+    """
+    return AsyncOpenAI(
+        http_client=DefaultAsyncHttpxClient(
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+        ),
+    )
+
+
+def _feedback_items(value: object, limit: int = 2) -> list[str]:
+    """Normalize a JSON feedback field; a bare string counts as one item."""
+    if isinstance(value, str):
+        return [value] if value.strip() else []
+    if not isinstance(value, list):
+        return []
+    return [str(item) for item in value[:limit]]
+
 
 @dataclass
 class ResponseScore:
@@ -45,45 +81,67 @@ class SessionMetrics:
     total_speaking_time_seconds: float = 0.0
     average_response_time_seconds: float = 0.0
     
+    # Running total so the average is updated in O(1)
+    _score_sum: int = field(default=0, init=False, repr=False)
+    
+    # Frozen summary once per-response scores have been released
+    _summary: Optional[dict[str, Any]] = field(default=None, init=False, repr=False)
+    
+    # Monotonic clock readings used for duration (immune to wall-clock jumps)
+    _started_mono: float = field(default_factory=time.monotonic, init=False, repr=False)
+    _ended_mono: Optional[float] = field(default=None, init=False, repr=False)
+    
     def add_score(self, score: ResponseScore) -> None:
-        """Add a score and update aggregates."""
+        """Add a score and update aggregates (ignored once compacted)."""
+        if self._summary is not None:
+            logger.warning(f"Ignoring score for compacted session {self.session_id}")
+            return
+        self._score_sum += score.overall
         self.scores.append(score)
         self.questions_answered += 1
-        
-        # Recalculate average
-        total = sum(s.overall for s in self.scores)
-        self.average_score = total / len(self.scores)
+        self.average_score = self._score_sum / self.questions_answered
     
-    def to_summary(self) -> dict:
+    def to_summary(self) -> dict[str, Any]:
         """Generate session summary."""
+        if self._summary is not None:
+            return self._summary
+        values = [s.overall for s in self.scores]
         return {
             "session_id": self.session_id,
             "interview_type": self.interview_type,
             "duration_minutes": self._duration_minutes(),
             "questions_answered": self.questions_answered,
             "average_score": round(self.average_score, 1),
-            "score_trend": self._score_trend(),
+            "score_trend": self._score_trend(values),
             "top_strengths": self._aggregate_feedback("strengths"),
             "areas_to_improve": self._aggregate_feedback("improvements"),
         }
     
+    def compact(self) -> dict[str, Any]:
+        """
+        Freeze the summary and release per-response scores to save memory.
+        
+        The session is final afterwards; later scores are ignored so the
+        summary and aggregates stay consistent.
+        """
+        self._summary = self.to_summary()
+        self.scores = []
+        return self._summary
+    
     def _duration_minutes(self) -> float:
         """Calculate session duration in minutes."""
-        if not self.ended_at:
+        if self._ended_mono is None:
             return 0.0
-        delta = self.ended_at - self.started_at
-        return round(delta.total_seconds() / 60, 1)
+        return round((self._ended_mono - self._started_mono) / 60, 1)
     
-    def _score_trend(self) -> str:
+    def _score_trend(self, values: list[int]) -> str:
         """Determine if scores are improving, declining, or stable."""
-        if len(self.scores) < 3:
+        if len(values) < 3:
             return "not_enough_data"
         
-        first_half = self.scores[: len(self.scores) // 2]
-        second_half = self.scores[len(self.scores) // 2 :]
-        
-        first_avg = sum(s.overall for s in first_half) / len(first_half)
-        second_avg = sum(s.overall for s in second_half) / len(second_half)
+        mid = len(values) // 2
+        first_avg = fmean(values[:mid])
+        second_avg = fmean(values[mid:])
         
         diff = second_avg - first_avg
         if diff > 0.5:
@@ -94,20 +152,41 @@ class SessionMetrics:
     
     def _aggregate_feedback(self, field_name: str) -> list[str]:
         """Aggregate feedback across all responses."""
-        all_items: list[str] = []
-        for score in self.scores:
-            items = getattr(score, field_name, [])
-            all_items.extend(items)
+        all_items = chain.from_iterable(getattr(score, field_name, []) for score in self.scores)
         
-        # Return unique items, preserving order
-        seen = set()
-        unique = []
-        for item in all_items:
-            if item not in seen:
-                seen.add(item)
-                unique.append(item)
-        
-        return unique[:5]  # Top 5 most common
+        # Unique items, preserving order (dict keys keep insertion order)
+        return list(islice(dict.fromkeys(all_items), 5))  # Top 5 most common
+
+
+class _JsonObjectTracker:
+    """Incrementally detects when a streamed top-level JSON object closes."""
+    
+    def __init__(self) -> None:
+        self._depth = 0
+        self._started = False
+        self._in_string = False
+        self._escaped = False
+    
+    def feed(self, text: str) -> bool:
+        """Consume a chunk of text; return True once the object is complete."""
+        for char in text:
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char == "{":
+                self._depth += 1
+                self._started = True
+            elif char == "}":
+                self._depth -= 1
+                if self._started and self._depth == 0:
+                    return True
+        return False
 
 
 class ResponseEvaluator:
@@ -120,15 +199,27 @@ class ResponseEvaluator:
     - Session-level analytics
     """
     
-    def __init__(self, openai_client: Optional[OpenAI] = None):
+    def __init__(
+        self,
+        openai_client: Optional[AsyncOpenAI] = None,
+        max_concurrent_evals: int = 8,
+        eval_batch_size: int = 5,
+        max_sessions: int = 256,
+    ):
         """
         Initialize the evaluator.
         
         Args:
-            openai_client: Optional OpenAI client (creates one if not provided)
+            openai_client: Optional async OpenAI client (shares a pooled one if not provided)
+            max_concurrent_evals: Cap on in-flight evaluation requests
+            eval_batch_size: Responses scored per LLM call in evaluate_batch
+            max_sessions: Sessions kept before the least recently used is evicted
         """
-        self._client = openai_client or OpenAI()
-        self._sessions: dict[str, SessionMetrics] = {}
+        self._client = openai_client or _shared_client()
+        self._sessions: OrderedDict[str, SessionMetrics] = OrderedDict()
+        self._semaphore = asyncio.Semaphore(max_concurrent_evals)
+        self._batch_size = eval_batch_size
+        self._max_sessions = max_sessions
     
     def start_session(
         self,
@@ -141,21 +232,38 @@ class ResponseEvaluator:
             interview_type=interview_type,
             started_at=datetime.now(),
         )
+        if session_id not in self._sessions and len(self._sessions) >= self._max_sessions:
+            evicted_id, _ = self._sessions.popitem(last=False)
+            logger.debug(f"Evicted least recently used session: {evicted_id}")
         self._sessions[session_id] = metrics
+        self._sessions.move_to_end(session_id)
         logger.info(f"Started evaluation session: {session_id}")
         return metrics
     
-    def end_session(self, session_id: str) -> Optional[SessionMetrics]:
-        """End a session and return final metrics."""
-        if session_id not in self._sessions:
+    def end_session(
+        self,
+        session_id: str,
+        compact: bool = False,
+    ) -> Optional[SessionMetrics]:
+        """
+        End a session and return final metrics.
+        
+        Args:
+            session_id: Session to end
+            compact: Keep only the summary and drop per-response scores
+        """
+        session = self.get_session(session_id)
+        if session is None:
             return None
         
-        session = self._sessions[session_id]
+        session._ended_mono = time.monotonic()
         session.ended_at = datetime.now()
+        if compact:
+            session.compact()
         logger.info(f"Ended session {session_id}: avg score {session.average_score:.1f}")
         return session
     
-    def evaluate_response(
+    async def evaluate_response(
         self,
         session_id: str,
         question: str,
@@ -171,25 +279,94 @@ class ResponseEvaluator:
             
         Returns:
             ResponseScore with detailed feedback
+            
+        Raises:
+            openai.OpenAIError: If the evaluation request fails (after the
+                client's own retries); no score is recorded in that case
         """
         # Generate evaluation using LLM
-        evaluation = self._generate_evaluation(question, response)
+        evaluation = await self._generate_evaluation(question, response)
         score = self._parse_evaluation(evaluation)
         
         # Update session metrics
-        if session_id in self._sessions:
-            self._sessions[session_id].add_score(score)
+        session = self.get_session(session_id)
+        if session is not None:
+            session.add_score(score)
         
         return score
     
+    async def evaluate_batch(
+        self,
+        session_id: str,
+        qa_pairs: list[tuple[str, str]],
+    ) -> list[ResponseScore]:
+        """
+        Evaluate several candidate responses concurrently.
+        
+        Pairs are grouped into batches of eval_batch_size that are each
+        scored in a single LLM call; batches are fanned out with
+        asyncio.gather so their network latency overlaps. Scores are
+        recorded in the original order.
+        
+        Args:
+            session_id: Current session ID
+            qa_pairs: (question, response) pairs to evaluate
+            
+        Returns:
+            ResponseScore for each pair, in input order
+            
+        Raises:
+            openai.OpenAIError: If an evaluation request fails (after the
+                client's own retries); no scores are recorded in that case
+        """
+        batches = [
+            qa_pairs[i : i + self._batch_size]
+            for i in range(0, len(qa_pairs), self._batch_size)
+        ]
+        results = await asyncio.gather(*(self._evaluate_chunk(b) for b in batches))
+        
+        session = self.get_session(session_id)
+        scores: list[ResponseScore] = []
+        for batch_scores in results:
+            for score in batch_scores:
+                if session is not None:
+                    session.add_score(score)
+                scores.append(score)
+        
+        return scores
+    
+    async def _evaluate_chunk(self, pairs: list[tuple[str, str]]) -> list[ResponseScore]:
+        """Score one batch, falling back to per-response calls on malformed output."""
+        items = await self._generate_evaluation_batch(pairs)
+        if len(items) == len(pairs):
+            try:
+                return [self._score_from_dict(item) for item in items]
+            except (KeyError, TypeError, ValueError) as e:
+                logger.warning(f"Malformed batch evaluation, retrying individually: {e}")
+        else:
+            logger.warning(
+                f"Batch evaluation returned {len(items)} of {len(pairs)} scores, "
+                "retrying individually"
+            )
+        
+        evaluations = await asyncio.gather(
+            *(self._generate_evaluation(q, r) for q, r in pairs)
+        )
+        return [self._parse_evaluation(evaluation) for evaluation in evaluations]
+    
     def get_session(self, session_id: str) -> Optional[SessionMetrics]:
         """Get session metrics by ID."""
-        return self._sessions.get(session_id)
+        session = self._sessions.get(session_id)
+        if session is not None:
+            self._sessions.move_to_end(session_id)
+        return session
     
-    def _generate_evaluation(self, question: str, response: str) -> str:
-        """Generate LLM-based evaluation."""
-        try:
-            completion = self._client.chat.completions.create(
+    async def _generate_evaluation(self, question: str, response: str) -> str:
+        """Generate LLM-based evaluation, streaming until the JSON object closes."""
+        parts: list[str] = []
+        tracker = _JsonObjectTracker()
+        async with self._semaphore:
+            stream = await self._client.chat.completions.create(
                 model="gpt-4o-mini",
                 messages=[
                     {"role": "system", "content": get_evaluation_prompt()},
@@ -200,25 +377,83 @@ class ResponseEvaluator:
                 ],
                 max_tokens=200,
                 temperature=0.3,
+                response_format={"type": "json_object"},
+                stream=True,
+            )
+            async with stream:
+                async for chunk in stream:
+                    if not chunk.choices:
+                        continue
+                    delta = chunk.choices[0].delta.content or ""
+                    parts.append(delta)
+                    if tracker.feed(delta):
+                        break
+        return "".join(parts)
+    
+    async def _generate_evaluation_batch(self, pairs: list[tuple[str, str]]) -> list[dict[str, Any]]:
+        """
+        Generate LLM-based evaluations for several responses in one call.
+        
+        Malformed or truncated output yields an empty list so the caller can
+        retry individually; API errors propagate.
+        """
+        numbered = "\n\n".join(
+            f"[{i}] Question: {question}\nCandidate Response: {response}"
+            for i, (question, response) in enumerate(pairs, 1)
+        )
+        async with self._semaphore:
+            completion = await self._client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[
+                    {"role": "system", "content": get_batch_evaluation_prompt()},
+                    {"role": "user", "content": numbered},
+                ],
+                max_tokens=200 * len(pairs),
+                temperature=0.3,
+                response_format={"type": "json_object"},
             )
-            return completion.choices[0].message.content or ""
-        except Exception as e:
-            logger.error(f"Evaluation failed: {e}")
-            return "Unable to evaluate response."
+        try:
+            data = json.loads(completion.choices[0].message.content or "{}")
+            evaluations = data.get("evaluations", [])
+        except (AttributeError, ValueError) as e:
+            logger.warning(f"Unparseable batch evaluation: {e}")
+            return []
+        return evaluations if isinstance(evaluations, list) else []
+    
+    def _score_from_dict(self, data: dict[str, Any], raw_feedback: str = "") -> ResponseScore:
+        """Build a score from a structured JSON evaluation."""
+        return ResponseScore(
+            overall=min(max(int(data["score"]), 1), 10),
+            strengths=_feedback_items(data.get("strengths")),
+            improvements=_feedback_items(data.get("improvements")),
+            raw_feedback=raw_feedback or json.dumps(data),
+        )
     
     def _parse_evaluation(self, evaluation: str) -> ResponseScore:
         """Parse LLM evaluation into structured score."""
+        try:
+            data = json.loads(evaluation)
+            return self._score_from_dict(data, raw_feedback=evaluation)
+        except (AttributeError, KeyError, TypeError, ValueError):
+            # Free-form reply - fall back to line parsing
+            return self._parse_text_evaluation(evaluation)
+    
+    def _parse_text_evaluation(self, evaluation: str) -> ResponseScore:
+        """Parse a free-form LLM evaluation line by line."""
         # Simple parsing - extract score and feedback
         score = 7  # Default
         strengths: list[str] = []
         improvements: list[str] = []
         
-        lines = evaluation.split("\n")
-        for line in lines:
-            line_lower = line.lower()
+        for line in evaluation.split("\n"):
+            # One regex pass per line decides which kind of line this is
+            match = _MARKER_RE.search(line)
+            if not match:
+                continue
+            kind = match.group("kind").lower()
             
             # Extract numeric score
-            if "score" in line_lower or "/10" in line:
+            if kind in ("score", "/10"):
                 for word in line.split():
                     try:
                         num = int(word.strip("():/"))
@@ -228,18 +463,16 @@ class ResponseEvaluator:
                     except ValueError:
                         continue
             
-            # Extract strengths
-            if "strength" in line_lower and ":" in line:
+            elif ":" in line:
                 content = line.split(":", 1)[1].strip()
-                if content:
+                if not content:
+                    continue
+                # Extract strengths
+                if kind == "strength":
                     strengths.append(content)
-            
-            # Extract improvements
-            if any(word in line_lower for word in ["improve", "suggestion", "consider"]):
-                if ":" in line:
-                    content = line.split(":", 1)[1].strip()
-                    if content:
-                        improvements.append(content)
+                # Extract improvements
+                else:
+                    improvements.append(content)
         
         return ResponseScore(
             overall=score,
@@ -12,7 +12,7 @@ import logging
 from typing import Optional
 
 from livekit import agents
-from livekit.agents import Agent, AgentSession, JobContext, RoomInputOptions, RunContext
+from livekit.agents import Agent, AgentSession, JobContext, JobProcess, RoomInputOptions, RunContext
 from livekit.agents.llm import ChatContext, ChatMessage
 from livekit.plugins import openai, silero
 
@@ -36,6 +36,8 @@ class InterviewAgent(Agent):
     
     def __init__(
         self,
+        *,
+        instructions: Optional[str] = None,
         interview_type: InterviewType = "behavioral",
         candidate_info: str = "",
         context: str = "",
@@ -44,24 +46,30 @@ class InterviewAgent(Agent):
         Initialize the interview agent.
         
         Args:
+            instructions: Pre-assembled system prompt (built from the
+                other arguments if not provided)
             interview_type: Type of interview to conduct
             candidate_info: Information about the candidate
             context: RAG-retrieved context
         """
-        super().__init__(
-            instructions=get_system_prompt(
+        if instructions is None:
+            instructions = get_system_prompt(
                 interview_type=interview_type,
                 context=context,
                 candidate_info=candidate_info,
             )
-        )
+        super().__init__(instructions=instructions)
         self.interview_type = interview_type
         self.candidate_info = candidate_info
         self.context = context
         self.settings = get_settings()
         
         # Initialize evaluator
-        self.evaluator = ResponseEvaluator()
+        self.evaluator = ResponseEvaluator(
+            max_concurrent_evals=self.settings.max_concurrent_evals,
+            eval_batch_size=self.settings.eval_batch_size,
+            max_sessions=self.settings.max_sessions_in_memory,
+        )
         
         # Session state
         self.session_id: Optional[str] = None
@@ -69,6 +77,16 @@ class InterviewAgent(Agent):
         self.question_count = 0
 
 
+def prewarm(proc: JobProcess) -> None:
+    """
+    Load models once per job process, before any job is assigned.
+    
+    The Silero VAD is loaded here so sessions don't pay for it after
+    the participant has joined.
+    """
+    proc.userdata["vad"] = silero.VAD.load()
+
+
 async def entrypoint(ctx: JobContext) -> None:
     """
     Main entrypoint for the LiveKit agent.
@@ -99,9 +117,9 @@ async def entrypoint(ctx: JobContext) -> None:
     
     settings = get_settings()
     
-    # Create the agent session with the new API
+    # Create the agent session with the new API (VAD preloaded by prewarm)
     session = AgentSession(
-        vad=silero.VAD.load(),
+        vad=ctx.proc.userdata["vad"],
         stt=openai.STT(),
         llm=openai.LLM(model=settings.openai_model),
         tts=openai.TTS(voice=settings.openai_tts_voice),
@@ -137,6 +155,7 @@ def main() -> None:
     agents.cli.run_app(
         agents.WorkerOptions(
             entrypoint_fnc=entrypoint,
+            prewarm_fnc=prewarm,
         ),
     )
 
@@ -5,6 +5,7 @@ Production-grade system prompts for different interview types.
 Crafted for natural conversation flow and effective coaching.
 """
 
+from functools import lru_cache
 from typing import Literal
 
 InterviewType = Literal["behavioral", "technical", "system_design"]
@@ -38,6 +39,11 @@ BASE_SYSTEM_PROMPT = """You are Alex, an expert AI interview coach at InterviewP
 """
 
 
+# Split once at import so assembly is plain concatenation (no format parsing)
+_BASE_HEAD, _BASE_REST = BASE_SYSTEM_PROMPT.split("{context}")
+_BASE_MIDDLE, _BASE_TAIL = _BASE_REST.split("{candidate_info}")
+
+
 # =============================================================================
 # Interview Type Prompts
 # =============================================================================
@@ -133,6 +139,37 @@ You are conducting a system design interview for senior engineering roles.
 """
 
 
+# =============================================================================
+# Evaluation Prompts
+# =============================================================================
+
+EVALUATION_PROMPT = """You are evaluating a candidate's interview response.
+
+Provide a brief, constructive evaluation with:
+- score: Overall quality of the response (integer 1-10)
+- strengths: What the candidate did well (1-2 short points)
+- improvements: Specific, actionable feedback (1-2 short points)
+
+Be encouraging but honest. Focus on the most impactful feedback.
+
+Return ONLY a JSON object of the form:
+{"score": 7, "strengths": ["..."], "improvements": ["..."]}"""
+
+
+BATCH_EVALUATION_PROMPT = """You are evaluating a set of candidate interview responses.
+
+For each numbered response, provide a brief, constructive evaluation with:
+- score: Overall quality of the response (integer 1-10)
+- strengths: What the candidate did well (1-2 short points)
+- improvements: Specific, actionable feedback (1-2 short points)
+
+Be encouraging but honest. Focus on the most impactful feedback.
+
+Return ONLY a JSON object of the form:
+{"evaluations": [{"score": 7, "strengths": ["..."], "improvements": ["..."]}]}
+with exactly one entry per response, in the same order as the responses."""
+
+
 # =============================================================================
 # Prompt Assembly
 # =============================================================================
@@ -152,6 +189,10 @@ def get_system_prompt(
     """
     Assemble the complete system prompt for an interview session.
     
+    Results are memoized, so agents started with the same room
+    configuration reuse the assembled prompt. Non-string values (e.g.
+    candidate info parsed from room metadata JSON) are rendered with str().
+    
     Args:
         interview_type: Type of interview to conduct
         context: RAG-retrieved context for the session
@@ -160,24 +201,29 @@ def get_system_prompt(
     Returns:
         Complete system prompt string
     """
-    base = BASE_SYSTEM_PROMPT.format(
-        context=context or "No additional context.",
-        candidate_info=candidate_info,
+    return _assemble_system_prompt(
+        str(interview_type),
+        str(context or "No additional context."),
+        str(candidate_info),
     )
+
+
+@lru_cache(maxsize=128)
+def _assemble_system_prompt(interview_type: str, context: str, candidate_info: str) -> str:
+    """Build the system prompt from string-only (hashable) arguments."""
+    type_prompt = INTERVIEW_PROMPTS.get(interview_type, BEHAVIORAL_PROMPT)  # type: ignore[call-overload]
     
-    type_prompt = INTERVIEW_PROMPTS.get(interview_type, BEHAVIORAL_PROMPT)
-    
-    return f"{base}\n\n{type_prompt}"
+    return (
+        f"{_BASE_HEAD}{context}"
+        f"{_BASE_MIDDLE}{candidate_info}{_BASE_TAIL}\n\n{type_prompt}"
+    )
 
 
 def get_evaluation_prompt() -> str:
     """Get the prompt for evaluating candidate responses."""
-    return """You are evaluating a candidate's interview response.
+    return EVALUATION_PROMPT
 
-Provide a brief, constructive evaluation with:
-1. **Score** (1-10): Overall quality of the response
-2. **Strengths**: What the candidate did well (1-2 points)
-3. **Improvements**: Specific, actionable feedback (1-2 points)
 
-Be encouraging but honest. Focus on the most impactful feedback.
-Keep your evaluation concise - 2-3 sentences max."""
+def get_batch_evaluation_prompt() -> str:
+    """Get the prompt for evaluating several candidate responses in one call."""
+    return BATCH_EVALUATION_PROMPT
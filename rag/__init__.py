@@ -5,6 +5,7 @@ Public interface for the RAG (Retrieval Augmented Generation) system.
 """
 
 from .chunker import SemanticChunker, create_chunker
+from .embedding_cache import EmbeddingCache
 from .loader import DocumentLoader
 from .retriever import ContextRetriever, InterviewCategory, create_retriever
 from .vectorstore import VectorStoreManager
@@ -17,6 +18,7 @@ __all__ = [
     "create_chunker",
     # Vector Store
     "VectorStoreManager",
+    "EmbeddingCache",
     # Retriever
     "ContextRetriever",
     "InterviewCategory",
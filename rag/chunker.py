@@ -6,13 +6,27 @@ RAG retrieval performance.
 """
 
 import logging
-from typing import Optional
+import math
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from typing import Any, Optional
 
 from langchain_core.documents import Document
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 
 logger = logging.getLogger(__name__)
 
+# Prefixes marking a chunk that opens with an interview question
+_QA_PREFIXES = ("Q:", "**Q:")
+
+# Markdown ATX header lines and code fence openers/closers
+_HEADER_RE = re.compile(r"^(#+)[ \t]+(.*?)[ \t]*$|^[ \t]*(?:```|~~~)", re.MULTILINE)
+
+# Header lines at the start of a chunk (skipped when classifying content)
+_LEADING_HEADERS_RE = re.compile(r"(?:#+[ \t][^\n]*(?:\n[ \t]*)*)+")
+
 
 class SemanticChunker:
     """
@@ -20,11 +34,19 @@ class SemanticChunker:
     
     Features:
     - Recursive splitting respecting document structure
+    - Single-pass header splitting for Markdown sources
     - Configurable chunk size and overlap
     - Metadata preservation and enhancement
     - Special handling for Q&A pairs
+    - Process-pool chunking for large ingestion batches
     """
 
+    # Batches larger than this are chunked in a process pool
+    PARALLEL_THRESHOLD = 100
+
+    # Documents handed to a worker process per task
+    PARALLEL_CHUNKSIZE = 32
+
     # Separators ordered by priority (most preferred first)
     DEFAULT_SEPARATORS = [
         "\n## ",      # H2 headers (new topic)
@@ -38,6 +60,12 @@ class SemanticChunker:
         "",           # Characters (last resort)
     ]
 
+    # Markdown headers split on in a single pass before character splitting
+    MARKDOWN_HEADERS = [("##", "h2"), ("###", "h3")]
+
+    # Separators for oversized Markdown sections (headers already split)
+    SECTION_SEPARATORS = ["\n\n", "\n- ", "\n* ", "\n", ". ", " ", ""]
+
     def __init__(
         self,
         chunk_size: int = 512,
@@ -56,19 +84,18 @@ class SemanticChunker:
         self.chunk_overlap = chunk_overlap
         self.separators = separators or self.DEFAULT_SEPARATORS
 
-        self._splitter = RecursiveCharacterTextSplitter(
-            chunk_size=chunk_size,
-            chunk_overlap=chunk_overlap,
-            separators=self.separators,
-            length_function=len,
-            is_separator_regex=False,
-            keep_separator=True,
+        self._splitter = _make_splitter(chunk_size, chunk_overlap, tuple(self.separators))
+        self._section_splitter = _make_splitter(
+            chunk_size, chunk_overlap, tuple(self.SECTION_SEPARATORS)
         )
 
     def chunk_documents(self, documents: list[Document]) -> list[Document]:
         """
         Split documents into semantically coherent chunks.
         
+        Large batches (more than PARALLEL_THRESHOLD documents) are chunked
+        across a process pool, since splitting is CPU-bound pure Python.
+        
         Args:
             documents: List of documents to chunk
             
@@ -79,64 +106,211 @@ class SemanticChunker:
             return []
 
         chunked_docs: list[Document] = []
+        workers = self._worker_count(len(documents))
         
-        for doc in documents:
-            chunks = self._chunk_single_document(doc)
-            chunked_docs.extend(chunks)
+        if workers > 1:
+            chunk_one = partial(
+                _chunk_document,
+                splitter=self._splitter,
+                section_splitter=self._section_splitter,
+                chunk_size=self.chunk_size,
+            )
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                for chunks in pool.map(
+                    chunk_one, documents, chunksize=self.PARALLEL_CHUNKSIZE
+                ):
+                    chunked_docs.extend(chunks)
+        else:
+            for doc in documents:
+                chunked_docs.extend(self._chunk_single_document(doc))
             
         logger.info(
             f"Chunked {len(documents)} documents into {len(chunked_docs)} chunks"
         )
         return chunked_docs
 
+    def _worker_count(self, num_documents: int) -> int:
+        """Number of worker processes worth spawning; 1 means chunk serially."""
+        if num_documents <= self.PARALLEL_THRESHOLD:
+            return 1
+        tasks = math.ceil(num_documents / self.PARALLEL_CHUNKSIZE)
+        return min(os.cpu_count() or 1, tasks)
+
     def _chunk_single_document(self, document: Document) -> list[Document]:
         """Process a single document into chunks."""
-        content = document.page_content
-        
-        # Skip very short documents
-        if len(content) <= self.chunk_size:
-            return [self._enhance_metadata(document, 0, 1)]
-        
-        # Split the document
-        chunks = self._splitter.split_text(content)
+        return _chunk_document(
+            document, self._splitter, self._section_splitter, self.chunk_size
+        )
+
+
+# =============================================================================
+# Chunking Helpers
+# =============================================================================
+# Module-level so they can be pickled into ProcessPoolExecutor workers.
+
+@lru_cache(maxsize=8)
+def _make_splitter(
+    chunk_size: int,
+    chunk_overlap: int,
+    separators: tuple[str, ...],
+) -> RecursiveCharacterTextSplitter:
+    """Get a splitter shared by all chunkers with the same parameters."""
+    return RecursiveCharacterTextSplitter(
+        chunk_size=chunk_size,
+        chunk_overlap=chunk_overlap,
+        separators=list(separators),
+        length_function=len,
+        is_separator_regex=False,
+        keep_separator=True,
+    )
+
+
+def _chunk_document(
+    document: Document,
+    splitter: RecursiveCharacterTextSplitter,
+    section_splitter: RecursiveCharacterTextSplitter,
+    chunk_size: int,
+) -> list[Document]:
+    """Process a single document into chunks."""
+    content = document.page_content
+    
+    # Short documents become a single chunk without touching the splitter
+    if len(content) <= chunk_size:
+        return [_enhance_metadata(document, 0, 1)]
+    
+    # Split the document
+    if document.metadata.get("file_type") == ".md":
+        chunks = _split_markdown(content, section_splitter, chunk_size)
+    else:
+        chunks = [(chunk_text, {}) for chunk_text in splitter.split_text(content)]
+    
+    # Share the source metadata; only chunk-specific keys are built per chunk
+    shared = document.metadata
+    total_chunks = len(chunks)
+    chunked_docs: list[Document] = []
+    for i, (chunk_text, section_metadata) in enumerate(chunks):
+        text = chunk_text.strip()
+        chunked_docs.append(
+            Document(
+                page_content=text,
+                metadata={
+                    **shared,
+                    **section_metadata,
+                    **_chunk_metadata(text, i, total_chunks),
+                },
+            )
+        )
         
-        # Create documents with enhanced metadata
-        chunked_docs: list[Document] = []
-        for i, chunk_text in enumerate(chunks):
-            chunk_doc = Document(
-                page_content=chunk_text.strip(),
-                metadata=document.metadata.copy(),
+    return chunked_docs
+
+
+def _split_markdown(
+    content: str,
+    section_splitter: RecursiveCharacterTextSplitter,
+    chunk_size: int,
+) -> list[tuple[str, dict[str, str]]]:
+    """
+    Split Markdown on H2/H3 headers first, then character-split only the
+    sections that are still too large.
+    
+    Returns:
+        (chunk_text, header_metadata) pairs in document order
+    """
+    chunks: list[tuple[str, dict[str, str]]] = []
+    for section_text, section_metadata in _markdown_sections(content):
+        if len(section_text) <= chunk_size:
+            chunks.append((section_text, section_metadata))
+        else:
+            chunks.extend(
+                (chunk_text, section_metadata)
+                for chunk_text in section_splitter.split_text(section_text)
             )
-            enhanced_doc = self._enhance_metadata(chunk_doc, i, len(chunks))
-            chunked_docs.append(enhanced_doc)
+    return chunks
+
+
+def _markdown_sections(content: str) -> list[tuple[str, dict[str, str]]]:
+    """
+    Cut Markdown at H2/H3 header lines, leaving the text itself untouched.
+    
+    Headers inside fenced code blocks are ignored, and header lines with
+    no text of their own stay attached to the section that follows. Each
+    section carries the titles of the H2/H3 headers it falls under.
+    
+    Returns:
+        (section_text, header_metadata) pairs in document order
+    """
+    header_keys = dict(SemanticChunker.MARKDOWN_HEADERS)
+    sections: list[tuple[str, dict[str, str]]] = []
+    current: dict[str, str] = {}
+    start = 0
+    in_fence = False
+    
+    for match in _HEADER_RE.finditer(content):
+        if match.group(1) is None:
+            in_fence = not in_fence
+            continue
+        key = header_keys.get(match.group(1))
+        if in_fence or key is None:
+            continue
             
-        return chunked_docs
+        pending = content[start : match.start()]
+        if not _is_headers_only(pending):
+            sections.append((pending, current))
+            start = match.start()
+        
+        # A header closes any deeper headers that were open
+        depth = len(match.group(1))
+        current = {
+            header_key: current[header_key]
+            for marker, header_key in header_keys.items()
+            if len(marker) < depth and header_key in current
+        }
+        current[key] = match.group(2)
+        
+    if content[start:].strip():
+        sections.append((content[start:], current))
+    return sections
 
-    def _enhance_metadata(
-        self,
-        document: Document,
-        chunk_index: int,
-        total_chunks: int,
-    ) -> Document:
-        """Add chunk-specific metadata."""
-        document.metadata.update({
-            "chunk_index": chunk_index,
-            "total_chunks": total_chunks,
-            "chunk_size": len(document.page_content),
-            "is_first_chunk": chunk_index == 0,
-            "is_last_chunk": chunk_index == total_chunks - 1,
-        })
+
+def _is_headers_only(text: str) -> bool:
+    """Whether text holds nothing but header lines and whitespace."""
+    leading_headers = _LEADING_HEADERS_RE.match(text)
+    end = leading_headers.end() if leading_headers else 0
+    return not text[end:].strip()
+
+
+def _enhance_metadata(
+    document: Document,
+    chunk_index: int,
+    total_chunks: int,
+) -> Document:
+    """Add chunk-specific metadata."""
+    document.metadata.update(
+        _chunk_metadata(document.page_content, chunk_index, total_chunks)
+    )
+    return document
+
+
+def _chunk_metadata(content: str, chunk_index: int, total_chunks: int) -> dict[str, Any]:
+    """Build the chunk-specific metadata keys for a piece of content."""
+    # Extract potential question from content, looking past a section's header
+    leading_headers = _LEADING_HEADERS_RE.match(content)
+    body = content[leading_headers.end() :] if leading_headers else content
+    if body.startswith(_QA_PREFIXES):
+        content_type = "qa_pair"
+    elif content.startswith("#"):
+        content_type = "heading"
+    else:
+        content_type = "text"
         
-        # Extract potential question from content
-        content = document.page_content
-        if content.startswith("Q:") or content.startswith("**Q:"):
-            document.metadata["content_type"] = "qa_pair"
-        elif content.startswith("#"):
-            document.metadata["content_type"] = "heading"
-        else:
-            document.metadata["content_type"] = "text"
-            
-        return document
+    return {
+        "chunk_index": chunk_index,
+        "total_chunks": total_chunks,
+        "chunk_size": len(content),
+        "is_first_chunk": chunk_index == 0,
+        "is_last_chunk": chunk_index == total_chunks - 1,
+        "content_type": content_type,
+    }
 
 
 def create_chunker(chunk_size: int = 512, chunk_overlap: int = 50) -> SemanticChunker:
@@ -0,0 +1,111 @@
+"""
+InterviewPilot - Embedding Cache
+
+Persistent content-hash to embedding cache so re-ingesting an unchanged
+knowledge base does not pay for the same OpenAI embedding calls again.
+"""
+
+import hashlib
+import sqlite3
+import threading
+from array import array
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Optional
+
+
+def content_hash(text: str) -> str:
+    """Stable BLAKE2b digest of a chunk's text."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class EmbeddingCache:
+    """
+    SQLite-backed embedding cache keyed by (content hash, model).
+
+    Vectors are stored as packed float32 blobs, matching the precision
+    ChromaDB keeps them at. The database is opened on first use, and its
+    single connection may be used from any thread (access is serialized).
+    """
+
+    # Stay well below SQLite's bound-parameter limit per statement
+    _LOOKUP_BATCH = 500
+
+    def __init__(self, db_path: Path):
+        """
+        Initialize the cache (no file is touched until first use).
+
+        Args:
+            db_path: SQLite file holding cached embeddings
+        """
+        self.db_path = Path(db_path)
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        """Open (or create) the cache database; call with the lock held."""
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                " hash TEXT NOT NULL,"
+                " model TEXT NOT NULL,"
+                " vec BLOB NOT NULL,"
+                " PRIMARY KEY (hash, model))"
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def get_many(self, hashes: Iterable[str], model: str) -> dict[str, list[float]]:
+        """
+        Look up cached embeddings.
+
+        Args:
+            hashes: Content hashes to look up
+            model: Embedding model the vectors must come from
+
+        Returns:
+            Mapping of hash to embedding for every cache hit
+        """
+        unique = list(dict.fromkeys(hashes))
+        found: dict[str, list[float]] = {}
+
+        with self._lock:
+            conn = self._connection()
+            for i in range(0, len(unique), self._LOOKUP_BATCH):
+                batch = unique[i : i + self._LOOKUP_BATCH]
+                placeholders = ",".join("?" * len(batch))
+                rows = conn.execute(
+                    f"SELECT hash, vec FROM embeddings WHERE model = ? AND hash IN ({placeholders})",
+                    [model, *batch],
+                ).fetchall()
+                for digest, blob in rows:
+                    found[digest] = array("f", blob).tolist()
+
+        return found
+
+    def put_many(self, items: Iterable[tuple[str, list[float]]], model: str) -> None:
+        """
+        Store embeddings in the cache.
+
+        Args:
+            items: (hash, embedding) pairs
+            model: Embedding model that produced the vectors
+        """
+        rows = [(digest, model, array("f", vec).tobytes()) for digest, vec in items]
+        with self._lock:
+            conn = self._connection()
+            conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (hash, model, vec) VALUES (?, ?, ?)",
+                rows,
+            )
+            conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection, if open (it reopens on next use)."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -6,8 +6,11 @@ and intelligent context assembly for interview coaching.
 """
 
 import logging
+import re
 from typing import Literal, Optional
 
+import numpy as np
+from chromadb.api.types import Where
 from langchain_core.documents import Document
 
 from .vectorstore import VectorStoreManager
@@ -17,6 +20,9 @@ logger = logging.getLogger(__name__)
 
 InterviewCategory = Literal["behavioral", "technical", "system_design", "general"]
 
+# Lines starting with "Q:" or "**Q:"; captures the question text
+_QUESTION_RE = re.compile(r"^\*{0,2}Q:[ \t]*(\S.*?)[ \t]*$", re.MULTILINE)
+
 
 class ContextRetriever:
     """
@@ -34,6 +40,8 @@ class ContextRetriever:
         vectorstore_manager: VectorStoreManager,
         default_k: int = 4,
         score_threshold: float = 0.7,
+        use_mmr: bool = True,
+        mmr_lambda: float = 0.5,
     ):
         """
         Initialize the retriever.
@@ -42,10 +50,14 @@ class ContextRetriever:
             vectorstore_manager: Vector store manager instance
             default_k: Default number of documents to retrieve
             score_threshold: Minimum similarity score (0-1, higher = more similar)
+            use_mmr: Re-rank candidates with Maximal Marginal Relevance
+            mmr_lambda: MMR trade-off (1 = pure relevance, 0 = pure diversity)
         """
         self.vectorstore = vectorstore_manager
         self.default_k = default_k
         self.score_threshold = score_threshold
+        self.use_mmr = use_mmr
+        self.mmr_lambda = mmr_lambda
 
     def retrieve(
         self,
@@ -65,23 +77,67 @@ class ContextRetriever:
             List of relevant documents
         """
         num_results = k or self.default_k
-        filter_dict = {"category": category} if category else None
+        filter_dict: Optional[Where] = {"category": category} if category else None
+        
+        if self.use_mmr:
+            filtered_docs = self._retrieve_mmr(query, num_results, filter_dict)
+        else:
+            filtered_docs = self._retrieve_similarity(query, num_results, filter_dict)
         
-        # Get results with scores
-        results = self.vectorstore.similarity_search_with_score(
+        logger.debug(f"Retrieved {len(filtered_docs)} documents for query: {query[:50]}...")
+        return filtered_docs
+
+    def _retrieve_similarity(
+        self,
+        query: str,
+        num_results: int,
+        filter_dict: Optional[Where],
+    ) -> list[Document]:
+        """Fetch the closest documents that pass the score threshold."""
+        # Over-fetch only when the threshold can actually drop results
+        filtering = self.score_threshold > 0
+        docs, distances = self.vectorstore.similarity_search_with_distances(
             query=query,
-            k=num_results * 2,  # Fetch extra for filtering
+            k=num_results * 2 if filtering else num_results,
             filter_dict=filter_dict,
         )
         
-        # Filter by score threshold and limit
-        filtered_docs = [
-            doc for doc, score in results
-            if score <= (1 - self.score_threshold)  # ChromaDB uses distance, not similarity
-        ][:num_results]
+        if not filtering:
+            return docs
         
-        logger.debug(f"Retrieved {len(filtered_docs)} documents for query: {query[:50]}...")
-        return filtered_docs
+        # Filter by score threshold and limit (one vectorized compare)
+        keep = self._passing_indices(distances)[:num_results]
+        return [docs[i] for i in keep.tolist()]
+
+    def _retrieve_mmr(
+        self,
+        query: str,
+        num_results: int,
+        filter_dict: Optional[Where],
+    ) -> list[Document]:
+        """Fetch candidates above the score threshold and pick a diverse subset."""
+        docs, distances, embeddings = self.vectorstore.similarity_search_with_vectors(
+            query=query,
+            k=num_results * 2,  # Candidate pool for filtering and diversity
+            filter_dict=filter_dict,
+        )
+        
+        keep = self._passing_indices(distances)
+        if keep.size == 0:
+            return []
+        
+        selected = _mmr_select(
+            1 - distances[keep],
+            embeddings[keep],
+            num_results,
+            self.mmr_lambda,
+        )
+        return [docs[i] for i in keep[selected].tolist()]
+
+    def _passing_indices(self, distances: np.ndarray) -> np.ndarray:
+        """Indices of candidates within the score threshold, in rank order."""
+        # ChromaDB uses distance, not similarity
+        return np.flatnonzero(distances <= (1 - self.score_threshold))
 
     def retrieve_for_question(
         self,
@@ -145,19 +201,16 @@ class ContextRetriever:
             k=count,
         )
         
-        # Extract questions from documents
+        # Extract questions from documents, stopping once we have enough
         questions: list[str] = []
         for doc in docs:
             if doc.metadata.get("content_type") == "qa_pair":
-                # Extract Q: prefix content
-                lines = doc.page_content.split("\n")
-                for line in lines:
-                    if line.startswith("Q:") or line.startswith("**Q:"):
-                        question = line.replace("**Q:", "").replace("Q:", "").strip()
-                        if question:
-                            questions.append(question)
+                for match in _QUESTION_RE.finditer(doc.page_content):
+                    questions.append(match.group(1))
+                    if len(questions) >= count:
+                        return questions
                             
-        return questions[:count]
+        return questions
 
     def _format_context(self, documents: list[Document]) -> str:
         """Format documents into a context string for LLM."""
@@ -178,6 +231,49 @@ class ContextRetriever:
         return "\n".join(context_parts)
 
 
+def _mmr_select(
+    query_similarity: np.ndarray,
+    embeddings: np.ndarray,
+    k: int,
+    lambda_mult: float,
+) -> list[int]:
+    """
+    Greedy Maximal Marginal Relevance selection.
+    
+    Candidate-to-candidate similarities are computed once as a single
+    matrix product; each greedy step is then vectorized indexing into it.
+    
+    Args:
+        query_similarity: Similarity of each candidate to the query, shape (n,)
+        embeddings: Candidate embeddings, shape (n, dim)
+        k: Number of candidates to select
+        lambda_mult: Relevance/diversity trade-off
+        
+    Returns:
+        Indices of the selected candidates, in selection order
+    """
+    num_candidates = len(query_similarity)
+    if num_candidates == 0:
+        return []
+    
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+    normalized = embeddings / np.where(norms == 0, 1, norms)
+    similarity = normalized @ normalized.T
+    
+    selected = [int(np.argmax(query_similarity))]
+    # Highest similarity of each candidate to anything already selected
+    redundancy = similarity[:, selected[0]].copy()
+    
+    while len(selected) < min(k, num_candidates):
+        scores = lambda_mult * query_similarity - (1 - lambda_mult) * redundancy
+        scores[selected] = -np.inf
+        best = int(np.argmax(scores))
+        selected.append(best)
+        redundancy = np.maximum(redundancy, similarity[:, best])
+        
+    return selected
+
+
 def create_retriever(
     persist_directory: str = "./data/chroma",
     embedding_model: str = "text-embedding-3-small",
@@ -5,18 +5,49 @@ Production-grade ChromaDB integration with collection management,
 document operations, and intelligent caching.
 """
 
+import asyncio
 import logging
+import os
+from collections.abc import Sequence
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional, TypeVar, cast
+from uuid import uuid4
 
 import chromadb
+import numpy as np
+from chromadb.api.models.Collection import Collection
+from chromadb.api.types import Include, Metadata, QueryResult, Where
 from chromadb.config import Settings as ChromaSettings
 from langchain_chroma import Chroma
 from langchain_core.documents import Document
 from langchain_openai import OpenAIEmbeddings
 
+from .embedding_cache import EmbeddingCache, content_hash
+
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+
+@lru_cache(maxsize=8)
+def _get_embeddings(model: str) -> OpenAIEmbeddings:
+    """Get the shared embeddings client for a model."""
+    return OpenAIEmbeddings(model=model)
+
+
+def _first(field: Optional[Sequence[_T]]) -> _T:
+    """Single-query entry of a ChromaDB result field requested via include."""
+    if field is None:
+        raise ValueError("Field missing from ChromaDB query result")
+    return field[0]
+
+
+@lru_cache(maxsize=1024)
+def _embed_query_cached(query: str, model: str) -> tuple[float, ...]:
+    """Embed a query, memoized per (query, model); tuples keep it hashable."""
+    return tuple(_get_embeddings(model).embed_query(query))
+
 
 class VectorStoreManager:
     """
@@ -31,11 +62,22 @@ class VectorStoreManager:
 
     DEFAULT_COLLECTION = "interview_knowledge"
 
+    # HNSW index parameters, fixed when a collection is created. Cosine space
+    # matches OpenAI embeddings and the 1 - distance similarity used by
+    # ContextRetriever; larger M/ef trade memory for recall and insert speed.
+    HNSW_METADATA = {
+        "hnsw:space": "cosine",
+        "hnsw:construction_ef": 200,
+        "hnsw:M": 32,
+        "hnsw:search_ef": 64,
+    }
+
     def __init__(
         self,
         persist_directory: str = "./data/chroma",
         embedding_model: str = "text-embedding-3-small",
         collection_name: Optional[str] = None,
+        embedding_cache_path: Optional[str] = None,
     ):
         """
         Initialize the vector store manager.
@@ -44,15 +86,24 @@ class VectorStoreManager:
             persist_directory: Directory for ChromaDB persistence
             embedding_model: OpenAI embedding model name
             collection_name: Name of the collection to use
+            embedding_cache_path: SQLite file for cached embeddings
+                (defaults to embedding_cache.sqlite3 in persist_directory;
+                opened on first ingest and kept across a ChromaDB reset)
         """
         self.persist_directory = Path(persist_directory)
         self.collection_name = collection_name or self.DEFAULT_COLLECTION
+        self.embedding_model = embedding_model
         
         # Ensure directory exists
         self.persist_directory.mkdir(parents=True, exist_ok=True)
         
-        # Initialize embeddings
-        self._embeddings = OpenAIEmbeddings(model=embedding_model)
+        # Initialize embeddings and the persistent embedding cache
+        self._embeddings = _get_embeddings(embedding_model)
+        self._embedding_cache = EmbeddingCache(
+            Path(embedding_cache_path)
+            if embedding_cache_path
+            else self.persist_directory / "embedding_cache.sqlite3"
+        )
         
         # Initialize ChromaDB client
         self._client = chromadb.PersistentClient(
@@ -63,9 +114,39 @@ class VectorStoreManager:
             ),
         )
         
-        # Initialize LangChain Chroma wrapper
+        # Native collection handle (ingest, query and stats paths), resolved
+        # once here and reopened lazily after delete/reset; LangChain wrapper
+        self._collection: Optional[Collection] = self._open_collection()
         self._vectorstore: Optional[Chroma] = None
 
+    @property
+    def collection(self) -> Collection:
+        """Get the native ChromaDB collection handle."""
+        if self._collection is None:
+            self._collection = self._open_collection()
+        return self._collection
+
+    def _open_collection(self) -> Collection:
+        """Get or create the collection on the ChromaDB client."""
+        collection = self._client.get_or_create_collection(
+            self.collection_name,
+            embedding_function=None,
+            metadata=self._collection_metadata(),
+        )
+        # HNSW settings only apply at creation; score thresholds assume cosine
+        hnsw = collection.configuration.get("hnsw") or {}
+        space = hnsw.get("space")
+        if space is not None and space != self.HNSW_METADATA["hnsw:space"]:
+            logger.warning(
+                f"Collection '{self.collection_name}' uses '{space}' distance, not cosine; "
+                "relevance scores will be wrong. Delete the collection and re-ingest."
+            )
+        return collection
+
+    def _collection_metadata(self) -> dict[str, Any]:
+        """HNSW settings, with index construction parallelized across cores."""
+        return {**self.HNSW_METADATA, "hnsw:num_threads": os.cpu_count() or 1}
+
     @property
     def vectorstore(self) -> Chroma:
         """Get or create the vector store instance."""
@@ -74,45 +155,188 @@ class VectorStoreManager:
                 client=self._client,
                 collection_name=self.collection_name,
                 embedding_function=self._embeddings,
+                collection_metadata=self._collection_metadata(),
             )
         return self._vectorstore
 
     def add_documents(
         self,
         documents: list[Document],
-        batch_size: int = 100,
+        batch_size: int = 2000,
     ) -> list[str]:
         """
         Add documents to the vector store.
         
+        Synchronous counterpart of aadd_documents: the same deduplication
+        and embedding cache apply, but each batch is embedded and then
+        written in turn. Safe to call from any thread, including one where
+        an event loop is running.
+        
         Args:
             documents: Documents to add
-            batch_size: Number of documents per batch
+            batch_size: Number of documents per batch (capped at the
+                client's maximum batch size)
             
         Returns:
-            List of document IDs
+            List of document IDs (one per unique document)
         """
         if not documents:
             logger.warning("No documents to add")
             return []
 
+        documents = self._deduplicate(documents)
+        batch_size = min(batch_size, self._client.get_max_batch_size())
+        collection = self.collection
         all_ids: list[str] = []
         
         # Process in batches to avoid memory issues
         for i in range(0, len(documents), batch_size):
             batch = documents[i : i + batch_size]
-            ids = self.vectorstore.add_documents(batch)
+            texts = [doc.page_content for doc in batch]
+            ids = [uuid4().hex for _ in batch]
+            collection.add(
+                ids=ids,
+                embeddings=np.asarray(self._embed_documents(texts), dtype=np.float32),
+                documents=texts,
+                metadatas=self._metadatas(batch),
+            )
             all_ids.extend(ids)
             logger.debug(f"Added batch {i // batch_size + 1}: {len(batch)} documents")
             
         logger.info(f"Added {len(all_ids)} documents to collection '{self.collection_name}'")
         return all_ids
 
+    async def aadd_documents(
+        self,
+        documents: list[Document],
+        batch_size: int = 2000,
+    ) -> list[str]:
+        """
+        Add documents to the vector store as an embed/write pipeline.
+        
+        Duplicate documents (same content and category) are dropped first.
+        Each batch is then embedded while the previous batch is written to
+        ChromaDB on a worker thread, overlapping OpenAI latency with
+        index insertion. Embeddings for unchanged content are served from
+        the embedding cache; only new content is sent to OpenAI.
+        
+        Args:
+            documents: Documents to add
+            batch_size: Number of documents per batch (capped at the
+                client's maximum batch size)
+            
+        Returns:
+            List of document IDs (one per unique document)
+        """
+        if not documents:
+            logger.warning("No documents to add")
+            return []
+
+        documents = self._deduplicate(documents)
+        batch_size = min(batch_size, self._client.get_max_batch_size())
+        collection = self.collection
+        all_ids: list[str] = []
+        pending_write: Optional[asyncio.Task[None]] = None
+        
+        # Process in batches to avoid memory issues
+        try:
+            for i in range(0, len(documents), batch_size):
+                batch = documents[i : i + batch_size]
+                texts = [doc.page_content for doc in batch]
+                embeddings = await self._aembed_documents(texts)
+                
+                # Previous write ran while this batch was being embedded
+                if pending_write is not None:
+                    await pending_write
+                    pending_write = None
+                    
+                ids = [uuid4().hex for _ in batch]
+                pending_write = asyncio.create_task(
+                    asyncio.to_thread(
+                        collection.add,
+                        ids=ids,
+                        embeddings=np.asarray(embeddings, dtype=np.float32),
+                        documents=texts,
+                        metadatas=self._metadatas(batch),
+                    )
+                )
+                all_ids.extend(ids)
+                logger.debug(f"Added batch {i // batch_size + 1}: {len(batch)} documents")
+        finally:
+            # Never return (or propagate an error) with a write still in flight
+            if pending_write is not None:
+                await pending_write
+            
+        logger.info(f"Added {len(all_ids)} documents to collection '{self.collection_name}'")
+        return all_ids
+
+    @staticmethod
+    def _metadatas(batch: list[Document]) -> list[Metadata]:
+        """Metadata to write for a batch of documents."""
+        # ChromaDB rejects empty metadata dicts; None marks "no metadata"
+        return cast(list[Metadata], [doc.metadata or None for doc in batch])
+
+    def _deduplicate(self, documents: list[Document]) -> list[Document]:
+        """Drop documents repeating the content of an earlier one in the same category."""
+        unique: dict[str, Document] = {}
+        for doc in documents:
+            key = content_hash(f"{doc.metadata.get('category', '')}\0{doc.page_content}")
+            unique.setdefault(key, doc)
+            
+        dropped = len(documents) - len(unique)
+        if dropped:
+            logger.info(f"Skipped {dropped} duplicate documents")
+        return list(unique.values())
+
+    def _embed_documents(self, texts: list[str]) -> list[list[float]]:
+        """Embed texts, reusing cached vectors for previously seen content."""
+        hashes, vectors, misses = self._lookup_embeddings(texts)
+        if misses:
+            fresh_vectors = self._embeddings.embed_documents(list(misses.values()))
+            self._store_embeddings(vectors, misses, fresh_vectors)
+        return [vectors[h] for h in hashes]
+
+    async def _aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        """Embed texts, reusing cached vectors for previously seen content."""
+        hashes, vectors, misses = self._lookup_embeddings(texts)
+        if misses:
+            fresh_vectors = await self._embeddings.aembed_documents(list(misses.values()))
+            self._store_embeddings(vectors, misses, fresh_vectors)
+        return [vectors[h] for h in hashes]
+
+    def _lookup_embeddings(
+        self,
+        texts: list[str],
+    ) -> tuple[list[str], dict[str, list[float]], dict[str, str]]:
+        """
+        Split texts into cache hits and misses.
+        
+        Returns:
+            (hash per text, cached vectors by hash, uncached text by hash);
+            each distinct uncached text appears once
+        """
+        hashes = [content_hash(text) for text in texts]
+        vectors = self._embedding_cache.get_many(hashes, self.embedding_model)
+        misses = {h: text for h, text in zip(hashes, texts, strict=True) if h not in vectors}
+        logger.debug(f"Embedding cache: {len(texts) - len(misses)} hits, {len(misses)} misses")
+        return hashes, vectors, misses
+
+    def _store_embeddings(
+        self,
+        vectors: dict[str, list[float]],
+        misses: dict[str, str],
+        fresh_vectors: list[list[float]],
+    ) -> None:
+        """Cache freshly embedded vectors and merge them into vectors."""
+        fresh = dict(zip(misses, fresh_vectors, strict=True))
+        self._embedding_cache.put_many(fresh.items(), self.embedding_model)
+        vectors.update(fresh)
+
     def similarity_search(
         self,
         query: str,
         k: int = 4,
-        filter_dict: Optional[dict] = None,
+        filter_dict: Optional[Where] = None,
     ) -> list[Document]:
         """
         Search for similar documents.
@@ -125,17 +349,13 @@ class VectorStoreManager:
         Returns:
             List of similar documents
         """
-        return self.vectorstore.similarity_search(
-            query=query,
-            k=k,
-            filter=filter_dict,
-        )
+        return [doc for doc, _ in self.similarity_search_with_score(query, k, filter_dict)]
 
     def similarity_search_with_score(
         self,
         query: str,
         k: int = 4,
-        filter_dict: Optional[dict] = None,
+        filter_dict: Optional[Where] = None,
     ) -> list[tuple[Document, float]]:
         """
         Search with relevance scores.
@@ -148,29 +368,115 @@ class VectorStoreManager:
         Returns:
             List of (document, score) tuples
         """
-        return self.vectorstore.similarity_search_with_score(
-            query=query,
-            k=k,
-            filter=filter_dict,
+        result = self._query(query, k, filter_dict, ["documents", "metadatas", "distances"])
+        return list(zip(self._to_documents(result), self._distances(result), strict=True))
+
+    def similarity_search_with_distances(
+        self,
+        query: str,
+        k: int = 4,
+        filter_dict: Optional[Where] = None,
+    ) -> tuple[list[Document], np.ndarray]:
+        """
+        Search returning distances as an array alongside documents.
+        
+        Args:
+            query: Search query
+            k: Number of results
+            filter_dict: Optional metadata filter
+            
+        Returns:
+            (documents, distances of shape (n,)) in rank order
+        """
+        result = self._query(query, k, filter_dict, ["documents", "metadatas", "distances"])
+        return self._to_documents(result), np.asarray(self._distances(result), dtype=np.float32)
+
+    def similarity_search_with_vectors(
+        self,
+        query: str,
+        k: int = 4,
+        filter_dict: Optional[Where] = None,
+    ) -> tuple[list[Document], np.ndarray, np.ndarray]:
+        """
+        Search returning distances and stored embeddings alongside documents.
+        
+        Args:
+            query: Search query
+            k: Number of results
+            filter_dict: Optional metadata filter
+            
+        Returns:
+            (documents, distances of shape (n,), embeddings of shape (n, dim))
+        """
+        result = self._query(
+            query, k, filter_dict, ["documents", "metadatas", "distances", "embeddings"]
+        )
+        documents = self._to_documents(result)
+        if not documents:
+            # Empty collection or a filter matching nothing
+            return [], np.empty(0, dtype=np.float32), np.empty((0, 0), dtype=np.float32)
+
+        distances = np.asarray(self._distances(result), dtype=np.float32)
+        embeddings = np.asarray(_first(result["embeddings"]), dtype=np.float32)
+        return documents, distances, embeddings.reshape(len(documents), -1)
+
+    def _query(
+        self,
+        query: str,
+        k: int,
+        filter_dict: Optional[Where],
+        include: Include,
+    ) -> QueryResult:
+        """Run a single-query native ChromaDB search."""
+        return self.collection.query(
+            query_embeddings=self._embed_query(query),  # One embedding, one result set
+            n_results=k,
+            where=filter_dict,
+            include=include,
         )
 
-    def get_collection_stats(self) -> dict:
+    def _to_documents(self, result: QueryResult) -> list[Document]:
+        """Rebuild Documents from a single-query ChromaDB result."""
+        return [
+            Document(id=doc_id, page_content=text, metadata=dict(metadata or {}))
+            for doc_id, text, metadata in zip(
+                result["ids"][0],
+                _first(result["documents"]),
+                _first(result["metadatas"]),
+                strict=True,
+            )
+        ]
+
+    def _distances(self, result: QueryResult) -> list[float]:
+        """Distances from a single-query ChromaDB result."""
+        return _first(result["distances"])
+
+    def _embed_query(self, query: str) -> list[float]:
+        """Embed a search query, reusing the vector for repeated queries."""
+        return list(_embed_query_cached(query, self.embedding_model))
+
+    def get_collection_stats(self) -> dict[str, Any]:
         """Get statistics about the current collection."""
-        collection = self._client.get_collection(self.collection_name)
         return {
             "name": self.collection_name,
-            "count": collection.count(),
+            "count": self.collection.count(),
             "persist_directory": str(self.persist_directory),
         }
 
     def delete_collection(self) -> None:
         """Delete the current collection."""
         self._client.delete_collection(self.collection_name)
+        self._collection = None
         self._vectorstore = None
         logger.info(f"Deleted collection '{self.collection_name}'")
 
     def reset(self) -> None:
         """Reset the entire database."""
         self._client.reset()
+        self._collection = None
         self._vectorstore = None
         logger.info("Reset ChromaDB")
+
+    def close(self) -> None:
+        """Close the embedding cache connection."""
+        self._embedding_cache.close()
@@ -0,0 +1,30 @@
+"""Shared fixtures."""
+
+import pytest
+
+from rag.vectorstore import VectorStoreManager
+
+
+class FakeEmbeddings:
+    """Deterministic embeddings that record how many texts were embedded."""
+
+    def __init__(self) -> None:
+        self.embedded: list[str] = []
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        self.embedded.extend(texts)
+        return [[float(len(text)), 1.0, 0.0] for text in texts]
+
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        return self.embed_documents(texts)
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    """Vector store in a temp directory with fake embeddings (no OpenAI calls)."""
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    vm = VectorStoreManager(persist_directory=str(tmp_path / "chroma"))
+    monkeypatch.setattr(vm, "_embeddings", FakeEmbeddings())
+    monkeypatch.setattr(vm, "_embed_query", lambda query: [1.0, 0.0, 0.0])
+    yield vm
+    vm.close()
@@ -0,0 +1,51 @@
+"""Tests for SemanticChunker Markdown handling."""
+
+from langchain_core.documents import Document
+
+from rag.chunker import SemanticChunker, _markdown_sections
+
+MARKDOWN = """# Guide
+
+## Coding
+
+Intro paragraph.
+
+```python
+def f():
+\tif x:
+        return 1
+## not a header
+```
+
+- item
+    - nested item
+
+### Follow-up
+
+**Q: Why does this work?**
+- Because it does.
+"""
+
+
+def test_markdown_sections_keep_raw_text():
+    sections = _markdown_sections(MARKDOWN)
+
+    assert "".join(text for text, _ in sections) == MARKDOWN
+    assert [metadata for _, metadata in sections] == [
+        {"h2": "Coding"},
+        {"h2": "Coding", "h3": "Follow-up"},
+    ]
+
+
+def test_chunk_markdown_preserves_content_and_classifies_questions():
+    document = Document(page_content=MARKDOWN, metadata={"file_type": ".md"})
+    chunks = SemanticChunker(chunk_size=100, chunk_overlap=0).chunk_documents([document])
+
+    joined = "\n".join(chunk.page_content for chunk in chunks)
+    assert "\tif x:\n        return 1" in joined
+    assert "\n    - nested item" in joined
+    assert "  \n" not in joined
+
+    assert chunks[-1].page_content.startswith("### Follow-up\n\n**Q:")
+    assert chunks[-1].metadata["content_type"] == "qa_pair"
+    assert chunks[-1].metadata["h3"] == "Follow-up"
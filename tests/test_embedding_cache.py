@@ -0,0 +1,42 @@
+"""Tests for the SQLite embedding cache."""
+
+import threading
+
+from rag.embedding_cache import EmbeddingCache, content_hash
+
+
+def test_cache_opens_lazily_and_reopens_after_close(tmp_path):
+    cache = EmbeddingCache(tmp_path / "cache.sqlite3")
+    assert not cache.db_path.exists()
+
+    digest = content_hash("hello")
+    cache.put_many([(digest, [0.5, 1.0])], model="m")
+    assert cache.db_path.exists()
+
+    cache.close()
+    assert cache.get_many([digest], model="m") == {digest: [0.5, 1.0]}
+    assert cache.get_many([digest], model="other") == {}
+    cache.close()
+
+
+def test_cache_usable_from_other_threads(tmp_path):
+    cache = EmbeddingCache(tmp_path / "cache.sqlite3")
+    cache.put_many([(content_hash("a"), [1.0])], model="m")
+    errors: list[BaseException] = []
+
+    def worker(text: str) -> None:
+        try:
+            cache.put_many([(content_hash(text), [2.0])], model="m")
+            cache.get_many([content_hash("a")], model="m")
+        except BaseException as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(str(i),)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert len(cache.get_many([content_hash(str(i)) for i in range(4)], model="m")) == 4
+    cache.close()
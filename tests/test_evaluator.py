@@ -0,0 +1,209 @@
+"""Tests for ResponseEvaluator parsing and session metrics."""
+
+import json
+import re
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from openai import AsyncOpenAI, OpenAIError
+
+from agent.evaluator import ResponseEvaluator, ResponseScore, _JsonObjectTracker
+
+
+class FakeStream:
+    """Async chat completion stream yielding one chunk per delta."""
+
+    def __init__(self, deltas: list[str]) -> None:
+        self._deltas = deltas
+        self.consumed = 0
+
+    async def __aenter__(self) -> "FakeStream":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        return None
+
+    async def __aiter__(self):
+        for delta in self._deltas:
+            self.consumed += 1
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=delta))])
+
+
+class FakeCompletions:
+    """Stands in for client.chat.completions; `reply` maps request kwargs to content."""
+
+    def __init__(self, reply) -> None:
+        self._reply = reply
+        self.calls: list[dict[str, Any]] = []
+        self.streams: list[FakeStream] = []
+
+    async def create(self, **kwargs: Any):
+        self.calls.append(kwargs)
+        content = self._reply(kwargs)
+        if isinstance(content, Exception):
+            raise content
+        if kwargs.get("stream"):
+            stream = FakeStream(content if isinstance(content, list) else [content])
+            self.streams.append(stream)
+            return stream
+        message = SimpleNamespace(content=content)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+def fake_evaluator(reply) -> tuple[ResponseEvaluator, FakeCompletions]:
+    completions = FakeCompletions(reply)
+    client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    return ResponseEvaluator(openai_client=client, eval_batch_size=2), completions
+
+
+def score_by_question(kwargs: dict[str, Any]) -> str:
+    """Per-response reply scoring question `qN` as N."""
+    question = re.search(r"Question: q(\d+)", kwargs["messages"][-1]["content"])
+    return json.dumps({"score": int(question.group(1))})
+
+
+@pytest.fixture
+def evaluator():
+    """Evaluator with an offline client (no requests are made)."""
+    return ResponseEvaluator(openai_client=AsyncOpenAI(api_key="test-key"))
+
+
+def test_parse_evaluation_wraps_bare_string_feedback(evaluator):
+    evaluation = json.dumps({
+        "score": 8,
+        "strengths": "clear structure",
+        "improvements": ["quantify impact", "shorter intro", "extra"],
+    })
+
+    score = evaluator._parse_evaluation(evaluation)
+
+    assert score.overall == 8
+    assert score.strengths == ["clear structure"]
+    assert score.improvements == ["quantify impact", "shorter intro"]
+
+
+def test_parse_evaluation_ignores_non_list_feedback(evaluator):
+    score = evaluator._parse_evaluation('{"score": 5, "strengths": null, "improvements": 3}')
+
+    assert score.strengths == []
+    assert score.improvements == []
+
+
+def test_compacted_session_ignores_later_scores(evaluator):
+    session = evaluator.start_session("s1", "behavioral")
+    for overall in (5, 7):
+        session.add_score(ResponseScore(overall=overall))
+    evaluator.end_session("s1", compact=True)
+
+    session.add_score(ResponseScore(overall=10))
+
+    assert session.questions_answered == 2
+    assert session.average_score == 6.0
+    assert session.to_summary()["questions_answered"] == 2
+
+
+def test_evaluator_does_not_require_livekit_settings(monkeypatch):
+    for name in ("LIVEKIT_URL", "LIVEKIT_API_KEY", "LIVEKIT_API_SECRET"):
+        monkeypatch.delenv(name, raising=False)
+
+    evaluator = ResponseEvaluator(openai_client=AsyncOpenAI(api_key="test-key"))
+    evaluator.start_session("a", "technical")
+
+    assert evaluator.get_session("a") is not None
+
+
+def test_sessions_evicted_least_recently_used_first():
+    evaluator = ResponseEvaluator(openai_client=AsyncOpenAI(api_key="test-key"), max_sessions=2)
+    evaluator.start_session("a", "technical")
+    evaluator.start_session("b", "technical")
+
+    # Looking a session up marks it as recently used
+    evaluator.get_session("a")
+    evaluator.start_session("c", "technical")
+
+    assert evaluator.get_session("b") is None
+    assert evaluator.get_session("a") is not None
+    assert evaluator.get_session("c") is not None
+
+    # Restarting an existing session does not evict another one
+    evaluator.start_session("a", "behavioral")
+    assert list(evaluator._sessions) == ["c", "a"]
+
+
+async def test_evaluate_batch_falls_back_on_short_output():
+    def reply(kwargs):
+        if kwargs.get("stream"):
+            return score_by_question(kwargs)
+        return json.dumps({"evaluations": [{"score": 9}]})
+
+    evaluator, completions = fake_evaluator(reply)
+    session = evaluator.start_session("s1", "technical")
+
+    scores = await evaluator.evaluate_batch("s1", [("q3", "a"), ("q4", "b")])
+
+    assert [score.overall for score in scores] == [3, 4]
+    assert sum(bool(call.get("stream")) for call in completions.calls) == 2
+    assert session.questions_answered == 2
+
+
+async def test_evaluate_batch_api_error_records_nothing():
+    evaluator, _ = fake_evaluator(lambda kwargs: OpenAIError("service unavailable"))
+    session = evaluator.start_session("s1", "technical")
+
+    with pytest.raises(OpenAIError):
+        await evaluator.evaluate_batch("s1", [("q1", "a"), ("q2", "b")])
+
+    assert session.questions_answered == 0
+    assert session.scores == []
+
+
+@pytest.mark.parametrize(
+    ("deltas", "closes_at"),
+    [
+        (['{"a": "}{"', ', "b": 1}'], 1),
+        (['{"a": "say \\"}\\" ok"}'], 0),
+        (['{"a": "\\\\"}'], 0),
+        (['{"a": {"b": {}}', ', "c": [1]}'], 1),
+        (['{"score": 8', "}", '{"extra": 1}'], 1),
+        (['{"a": "unterminated }'], None),
+    ],
+)
+def test_json_object_tracker(deltas, closes_at):
+    tracker = _JsonObjectTracker()
+    closed = [tracker.feed(delta) for delta in deltas]
+
+    if closes_at is None:
+        assert not any(closed)
+    else:
+        assert closed.index(True) == closes_at
+
+
+async def test_evaluate_response_stops_streaming_when_object_closes():
+    deltas = ['{"score": 6, "strengths": ["uses {braces}"', "]", "}", "trailing text"]
+    evaluator, completions = fake_evaluator(lambda kwargs: deltas)
+    session = evaluator.start_session("s1", "technical")
+
+    score = await evaluator.evaluate_response("s1", "q", "a")
+
+    assert score.overall == 6
+    assert score.strengths == ["uses {braces}"]
+    assert score.raw_feedback == "".join(deltas[:3])
+    assert completions.streams[0].consumed == 3
+    assert session.questions_answered == 1
+
+
+async def test_evaluate_batch_preserves_input_order():
+    def reply(kwargs):
+        questions = re.findall(r"Question: q(\d+)", kwargs["messages"][-1]["content"])
+        return json.dumps({"evaluations": [{"score": int(q)} for q in questions]})
+
+    evaluator, completions = fake_evaluator(reply)
+    session = evaluator.start_session("s1", "technical")
+    pairs = [(f"q{n}", "a") for n in (5, 2, 9, 1, 7)]
+
+    scores = await evaluator.evaluate_batch("s1", pairs)
+
+    assert [score.overall for score in scores] == [5, 2, 9, 1, 7]
+    assert [score.overall for score in session.scores] == [5, 2, 9, 1, 7]
+    assert len(completions.calls) == 3
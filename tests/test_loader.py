@@ -0,0 +1,51 @@
+"""Tests for DocumentLoader text reading and directory traversal."""
+
+import pytest
+
+from rag.loader import DocumentLoader
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [b"one\r\ntwo\r\n", b"one\rtwo\r", b"mixed\r\nline\rend\n", "café\r\n".encode()],
+)
+def test_read_utf8_normalizes_newlines_like_read_text(tmp_path, raw):
+    path = tmp_path / "notes.txt"
+    path.write_bytes(raw)
+
+    assert DocumentLoader(tmp_path)._read_utf8(path) == path.read_text(encoding="utf-8")
+
+
+def test_load_empty_file(tmp_path):
+    path = tmp_path / "empty.md"
+    path.touch()
+
+    [document] = DocumentLoader(tmp_path).load_file(path)
+
+    assert document.page_content == ""
+
+
+def test_iter_files_matches_suffix_case_insensitively(tmp_path):
+    (tmp_path / "sub").mkdir()
+    for name in ("a.md", "B.TXT", "c.Pdf", "d.py", "sub/e.md"):
+        (tmp_path / name).write_text("x")
+    loader = DocumentLoader(tmp_path)
+
+    flat = {path.name for path in loader._iter_files(tmp_path, recursive=False)}
+    nested = {path.name for path in loader._iter_files(tmp_path, recursive=True)}
+
+    assert flat == {"a.md", "B.TXT", "c.Pdf"}
+    assert nested == flat | {"e.md"}
+
+
+def test_load_directory_categories(tmp_path):
+    (tmp_path / "behavioral" / "star").mkdir(parents=True)
+    (tmp_path / "behavioral" / "star" / "method.md").write_text("STAR")
+    (tmp_path / "technical").mkdir()
+    (tmp_path / "technical" / "dsa.md").write_text("DSA")
+    (tmp_path / "readme.txt").write_text("root")
+
+    documents = DocumentLoader(tmp_path).load_directory(parallel=False)
+
+    categories = {doc.metadata["filename"]: doc.metadata["category"] for doc in documents}
+    assert categories == {"method.md": "behavioral", "dsa.md": "technical", "readme.txt": "general"}
@@ -0,0 +1,57 @@
+"""Tests for ContextRetriever against a local ChromaDB collection."""
+
+import numpy as np
+import pytest
+
+from rag.retriever import ContextRetriever, _mmr_select
+
+
+@pytest.mark.parametrize("use_mmr", [True, False])
+def test_retrieve_empty_collection(manager, use_mmr):
+    retriever = ContextRetriever(manager, use_mmr=use_mmr)
+
+    assert retriever.retrieve("q") == []
+    assert retriever.retrieve("q", category="technical") == []
+
+
+@pytest.mark.parametrize("use_mmr", [True, False])
+def test_retrieve_filter_matches_nothing(manager, use_mmr):
+    manager.collection.add(
+        ids=["a"],
+        embeddings=[[1.0, 0.0, 0.0]],
+        documents=["Tell me about a conflict you resolved."],
+        metadatas=[{"category": "behavioral"}],
+    )
+    retriever = ContextRetriever(manager, use_mmr=use_mmr)
+
+    assert retriever.retrieve("q", category="technical") == []
+    assert [doc.id for doc in retriever.retrieve("q")] == ["a"]
+
+
+def test_similarity_search_with_vectors_empty(manager):
+    docs, distances, embeddings = manager.similarity_search_with_vectors("q")
+
+    assert docs == []
+    assert distances.shape == (0,)
+    assert embeddings.shape == (0, 0)
+
+
+@pytest.mark.parametrize("use_mmr", [True, False])
+def test_retrieve_applies_score_threshold(manager, use_mmr):
+    manager.collection.add(
+        ids=["exact", "orthogonal", "close"],
+        embeddings=[[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [1.0, 1.0, 0.0]],
+        documents=["exact", "orthogonal", "close"],
+    )
+    retriever = ContextRetriever(manager, score_threshold=0.7, use_mmr=use_mmr)
+
+    assert [doc.id for doc in retriever.retrieve("q")] == ["exact", "close"]
+    assert [doc.id for doc in retriever.retrieve("q", k=1)] == ["exact"]
+
+
+@pytest.mark.parametrize(("lambda_mult", "expected"), [(0.5, [0, 2]), (1.0, [0, 1])])
+def test_mmr_select_skips_near_duplicates(lambda_mult, expected):
+    query_similarity = np.array([0.9, 0.89, 0.7])
+    embeddings = np.array([[1.0, 0.0], [1.0, 0.01], [0.0, 1.0]])
+
+    assert _mmr_select(query_similarity, embeddings, k=2, lambda_mult=lambda_mult) == expected
@@ -0,0 +1,94 @@
+"""Tests for VectorStoreManager ingest."""
+
+import asyncio
+import logging
+import time
+
+import pytest
+from langchain_core.documents import Document
+
+
+def _documents(count: int) -> list[Document]:
+    return [
+        Document(page_content=f"document {i}", metadata={"category": "general"})
+        for i in range(count)
+    ]
+
+
+def test_add_documents_inside_running_loop(manager):
+    async def ingest() -> tuple[list[str], list[str]]:
+        direct = manager.add_documents(_documents(3))
+        threaded = await asyncio.to_thread(manager.add_documents, _documents(3))
+        return direct, threaded
+
+    direct, threaded = asyncio.run(ingest())
+
+    assert len(direct) == len(threaded) == 3
+    assert manager.collection.count() == 6
+    # Second ingest of the same content is served from the embedding cache
+    assert len(manager._embeddings.embedded) == 3
+
+
+def test_aadd_documents_deduplicates_and_uses_cache(manager):
+    manager.add_documents(_documents(2))
+
+    ids = asyncio.run(manager.aadd_documents(_documents(3) + _documents(3)))
+
+    assert len(ids) == 3
+    assert manager._embeddings.embedded == ["document 0", "document 1", "document 2"]
+
+
+def test_add_documents_without_metadata(manager):
+    documents = [Document(page_content="no metadata"), *_documents(1)]
+
+    manager.add_documents(documents)
+    asyncio.run(manager.aadd_documents([Document(page_content="async, no metadata")]))
+
+    results = {doc.page_content: doc.metadata for doc in manager.similarity_search("q", k=3)}
+    assert results["no metadata"] == {}
+    assert results["async, no metadata"] == {}
+    assert results["document 0"] == {"category": "general"}
+
+
+def test_aadd_documents_waits_for_pending_write_on_error(manager, monkeypatch):
+    collection = manager.collection
+    add = collection.add
+    written: list[int] = []
+
+    def slow_add(**kwargs) -> None:
+        time.sleep(0.2)
+        add(**kwargs)
+        written.append(len(kwargs["ids"]))
+
+    async def embed_once(texts: list[str]) -> list[list[float]]:
+        if manager._embeddings.embedded:
+            raise RuntimeError("embedding failed")
+        return manager._embeddings.embed_documents(texts)
+
+    monkeypatch.setattr(collection, "add", slow_add)
+    monkeypatch.setattr(manager, "_aembed_documents", embed_once)
+
+    async def ingest() -> list[int]:
+        with pytest.raises(RuntimeError):
+            await manager.aadd_documents(_documents(2), batch_size=1)
+        # Checked before asyncio.run() shuts down the thread pool
+        return list(written)
+
+    assert asyncio.run(ingest()) == [1]
+
+
+def test_open_collection_warns_on_non_cosine_space(manager, caplog):
+    manager.delete_collection()
+    manager._client.create_collection(manager.collection_name, embedding_function=None)
+
+    with caplog.at_level(logging.WARNING, logger="rag.vectorstore"):
+        manager._open_collection()
+
+    assert "uses 'l2' distance" in caplog.text
+
+
+def test_open_collection_cosine_space_no_warning(manager, caplog):
+    with caplog.at_level(logging.WARNING, logger="rag.vectorstore"):
+        manager._open_collection()
+
+    assert caplog.text == ""